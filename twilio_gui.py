@@ -2,73 +2,268 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import os
+import re
 import csv
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 import base64
-from typing import List, Dict
+import ssl
+from typing import List, Dict, NamedTuple
 import requests
+from requests.adapters import HTTPAdapter
 import certifi
 from urllib.parse import urlencode
-import urllib3
 from tkcalendar import DateEntry
 import time
+import queue
+import threading
+from functools import lru_cache
+from itertools import accumulate
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter, itemgetter
+from contextlib import contextmanager
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Flattens message bodies onto one grid line in a single pass
+_BODY_TR = str.maketrans({'\n': ' ', '\r': None})
+
+# Number config fields shown in the config tab, as (label, key path into the API response)
+_CONFIG_FIELDS = (
+    ('Phone Number', ('phone_number',)),
+    ('Friendly Name', ('friendly_name',)),
+    ('SID', ('sid',)),
+    ('Voice URL', ('voice_url',)),
+    ('Voice Method', ('voice_method',)),
+    ('Voice Fallback URL', ('voice_fallback_url',)),
+    ('Status Callback URL', ('status_callback',)),
+    ('SMS URL', ('sms_url',)),
+    ('SMS Method', ('sms_method',)),
+    ('SMS Fallback URL', ('sms_fallback_url',)),
+    ('Capabilities - Voice', ('capabilities', 'voice')),
+    ('Capabilities - SMS', ('capabilities', 'sms')),
+    ('Capabilities - MMS', ('capabilities', 'mms')),
+    ('Emergency Enabled', ('emergency_status',)),
+    ('Trunk SID', ('trunk_sid',)),
+    ('Voice Application SID', ('voice_application_sid',)),
+    ('SMS Application SID', ('sms_application_sid',))
+)
+
+def _dig(data, path):
+    """Follow a key path into nested dicts, returning '' where it runs out"""
+    for key in path:
+        if not isinstance(data, dict):
+            return ''
+        data = data.get(key, '')
+    return data
+
+# E.164 as typed, or a US number as 10 digits with an optional leading 1
+_PHONE_RE = re.compile(r'\+\d+|1?(\d{10})')
+_PHONE_PUNCTUATION = str.maketrans('', '', ' -().')
+
+# Row color tag per call/message status: none for success, red for failures; anything else is yellow
+_STATUS_TAGS = {
+    'delivered': '', 'completed': '', 'received': '',
+    'failed': 'error', 'canceled': 'error', 'busy': 'error', 'no-answer': 'error', 'undelivered': 'error'
+}
+
+# Tcl lambda that appends (item id, value, ...) rows to a Treeview, so a whole list is inserted in one
+# call rather than a tree.insert per row; the rows are passed as a Tcl list, so values need no quoting
+_TREE_BULK_INSERT = '{tree rows} {foreach row $rows {$tree insert {} end -id [lindex $row 0] -values [lrange $row 1 end]}}'
+
+# Account SIDs are 'AC' followed by 32 hex digits
+_ACCOUNT_SID_RE = re.compile(r'AC[0-9a-fA-F]{32}')
+
+def _normalize_phone(phone: str):
+    """Return the number in E.164 form, or None if it isn't a recognizable phone number"""
+    match = _PHONE_RE.fullmatch(phone.translate(_PHONE_PUNCTUATION))
+    if not match:
+        return None
+    return f'+1{match.group(1)}' if match.group(1) else match.group(0)
+
+_MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+           'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
+@lru_cache(maxsize=4096)
+def _parse_twilio_timestamp(timestamp: str):
+    """Convert a Twilio UTC timestamp to (local time string, Unix sort key)"""
+    try:
+        if len(timestamp) == 31:
+            # Fixed RFC 2822 layout, e.g. 'Mon, 05 Feb 2024 13:45:02 +0000' - slice it instead of using strptime
+            offset = timedelta(hours=int(timestamp[27:29]), minutes=int(timestamp[29:31]))
+            if timestamp[26] == '-':
+                offset = -offset
+            dt = datetime(int(timestamp[12:16]), _MONTHS[timestamp[8:11]], int(timestamp[5:7]),
+                          int(timestamp[17:19]), int(timestamp[20:22]), int(timestamp[23:25]),
+                          tzinfo=timezone(offset))
+        else:
+            # Any other RFC 2822 variant; unlike strptime's %a/%b this doesn't depend on the locale
+            dt = parsedate_to_datetime(timestamp)
+        # Format the fields directly; strftime goes through the locale machinery on every row
+        local = dt.astimezone()
+        return (f'{local.year:04d}-{local.month:02d}-{local.day:02d} '
+                f'{local.hour:02d}:{local.minute:02d}:{local.second:02d}'), dt.timestamp()
+    except:
+        return timestamp, 0
+
+# Result rows are tuples rather than dicts: a fraction of the memory for large lookups,
+# and the first _VISIBLE_FIELDS fields are exactly the tree's columns, in order
+_VISIBLE_FIELDS = 7
+
+class CallRow(NamedTuple):
+    direction: str
+    from_number: str
+    to_number: str
+    start_time: str
+    duration: str
+    status: str
+    sid: str
+    sort_key: float
+    events_uri: str
+
+class MessageRow(NamedTuple):
+    direction: str
+    from_number: str
+    to_number: str
+    date_sent: str
+    body: str
+    status: str
+    sid: str
+    sort_key: float
+    error_code: str
+    error_message: str
+
+# Fields the results filter searches, per row type: the text fields, not the numeric sort key
+# (typing digits would match every row's timestamp) or API URIs
+_SEARCHED_FIELDS = {
+    row_type: itemgetter(*[i for i, field in enumerate(row_type._fields) if field not in ('sort_key', 'events_uri')])
+    for row_type in (CallRow, MessageRow)
+}
 
 class TwilioConfig:
     def __init__(self):
         self.config_path = Path.home() / '.twilio_gui_config.json'
+        self._decoded = {}  # Accounts with auth_token already base64-decoded, filled on first use
         self.accounts = self.load_accounts()
+        self.account_names = sorted(self.accounts)  # Kept sorted as accounts are added and deleted
+        # Account SID -> number of saved names using it, kept up to date so imports can skip known SIDs
+        self.account_sids = Counter(details['account_sid'] for details in self.accounts.values())
     
     def load_accounts(self) -> Dict:
         if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            with open(self.config_path, 'rb') as f:
+                return _json_loads(f.read())
         return {}
     
     def save_accounts(self):
-        with open(self.config_path, 'w') as f:
+        # Write a temp file and swap it in, so a crash mid-write can't leave a truncated config
+        tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
             json.dump(self.accounts, f, indent=2)
+        os.replace(tmp_path, self.config_path)
     
     def add_account(self, name: str, account_sid: str, auth_token: str):
-        self.accounts[name] = {
-            'account_sid': account_sid,
-            'auth_token': base64.b64encode(auth_token.encode()).decode()
-        }
-        self.save_accounts()
+        self.add_accounts([(name, account_sid, auth_token)])
+    
+    def add_accounts(self, accounts: List[tuple]):
+        """Add (name, account_sid, auth_token) entries and write the file once"""
+        for name, account_sid, auth_token in accounts:
+            if name in self.accounts:
+                self._release_sid(self.accounts[name]['account_sid'])
+            else:
+                insort(self.account_names, name)
+            self.account_sids[account_sid] += 1
+            self.accounts[name] = {
+                'account_sid': account_sid,
+                'auth_token': base64.b64encode(auth_token.encode()).decode()
+            }
+            self._decoded[name] = {'account_sid': account_sid, 'auth_token': auth_token}
+        if accounts:
+            self.save_accounts()
     
     def get_account(self, name: str) -> Dict:
+        """Return the decoded account; callers only read it, so the cached dict is shared"""
         if name in self.accounts:
-            acc = self.accounts[name].copy()
-            acc['auth_token'] = base64.b64decode(acc['auth_token']).decode()
-            return acc
+            if name not in self._decoded:
+                acc = self.accounts[name].copy()
+                acc['auth_token'] = base64.b64decode(acc['auth_token']).decode()
+                self._decoded[name] = acc
+            return self._decoded[name]
         return None
     
     def delete_account(self, name: str):
         if name in self.accounts:
-            del self.accounts[name]
+            self._release_sid(self.accounts.pop(name)['account_sid'])
+            del self.account_names[bisect_left(self.account_names, name)]
+            self._decoded.pop(name, None)
             self.save_accounts()
+    
+    def _release_sid(self, account_sid: str):
+        # Drop SIDs no name uses any more, so membership tests on account_sids stay accurate
+        self.account_sids[account_sid] -= 1
+        if self.account_sids[account_sid] <= 0:
+            del self.account_sids[account_sid]
+
+class _SharedContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections all reuse one SSL context, so the CA bundle is parsed once
+    instead of on every new connection"""
+    def __init__(self, ssl_context, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+    
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True:
+            # requests points every pool at the default CA bundle, which urllib3 would then load into
+            # the shared context again for each new connection; the context already trusts it
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
 
 class TwilioAPI:
-    def __init__(self, account_sid: str, auth_token: str):
+    def __init__(self, account_sid: str, auth_token: str, cancel_event: threading.Event = None):
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.base_url = f'https://api.twilio.com/2010-04-01/Accounts/{account_sid}'
         self.timeout = 30
         self.max_retries = 3
+        self.cache_ttl = 60  # Seconds to reuse single-resource lookups
+        self.inventory_ttl = 300  # Phone numbers and their config rarely change mid-session
+        self._cache = {}  # (resource, sid) -> (fetched_at, response)
+        self._throttled_until = 0.0  # time.monotonic() before which no request is sent, set by 429 responses
+        self.cancel_event = cancel_event or threading.Event()  # Once set, paging stops and requests raise instead of being sent
+        
+        # Persistent session keeps the TLS connections to api.twilio.com alive between requests.
+        # Everything goes to one host, so a single pool sized above the busiest fan-out (32
+        # concurrent scan probes) lets concurrent requests reuse sockets instead of
+        # opening throwaway connections; pool_block waits for a free socket rather than discarding one.
+        self.session = requests.Session()
+        self.session.auth = (account_sid, auth_token)
+        # verify=True rather than a CA path, so the adapter can keep urllib3 from reloading the bundle per connection
+        self.session.verify = True
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        self.session.mount('https://', _SharedContextAdapter(ssl_context, pool_connections=1, pool_maxsize=64, pool_block=True, max_retries=0))
     
     def get_subaccounts(self) -> List[Dict]:
         """Fetch all sub-accounts (and parent account) from Twilio"""
+        return self._cached(('subaccounts',), self._fetch_subaccounts)
+    
+    def _fetch_subaccounts(self) -> List[Dict]:
         url = 'https://api.twilio.com/2010-04-01/Accounts.json'
         all_accounts = []
         
-        while url:
-            response = self._make_request(url)
-            if response.status_code != 200:
-                raise Exception(f"API Error: {response.status_code}\nResponse: {response.text}")
-            
-            data = response.json()
+        # Pages are cursor-linked and can't be fetched in parallel, so ask for Twilio's maximum page size
+        for data in self._iter_pages(url, {'PageSize': 1000}):
             for acc in data.get('accounts', []):
                 if acc.get('status') == 'active':  # Only active accounts
                     all_accounts.append({
@@ -78,223 +273,271 @@ class TwilioAPI:
                         'type': acc.get('type', ''),
                         'owner_account_sid': acc.get('owner_account_sid', '')
                     })
-            
-            url = data.get('next_page_uri')
-            if url:
-                url = f'https://api.twilio.com{url}'
         
         return all_accounts
     
     def _make_request(self, url: str, params: Dict = None) -> requests.Response:
         """Make HTTP request with timeout and retry logic"""
-        auth = (self.account_sid, self.auth_token)
-        
         for attempt in range(self.max_retries):
+            # Once Twilio has said to slow down, every thread sharing this client waits it out
+            wait = self._throttled_until - time.monotonic()
+            if wait > 0:
+                self.cancel_event.wait(wait)
+            self._check_cancelled()
+            
+            # Back off 1s, 2s, 4s... so concurrent workers don't retry in lockstep
+            backoff = 2 ** attempt
             try:
-                return requests.get(url, auth=auth, params=params, verify=False, timeout=self.timeout)
+                response = self.session.get(url, params=params, timeout=self.timeout)
             except requests.exceptions.Timeout:
                 if attempt == self.max_retries - 1:
                     raise Exception(f"Request timed out after {self.max_retries} attempts")
-                time.sleep(1)
+                self.cancel_event.wait(backoff)
+                continue
             except requests.exceptions.ConnectionError:
                 if attempt == self.max_retries - 1:
                     raise Exception(f"Connection failed after {self.max_retries} attempts. Check your internet connection.")
-                time.sleep(1)
+                self.cancel_event.wait(backoff)
+                continue
             except requests.exceptions.RequestException as e:
                 raise Exception(f"Network error: {str(e)}")
+            
+            # Twilio answers 429 when too many requests are in flight for the account,
+            # usually with a Retry-After telling us how long to hold off
+            if response.status_code == 429 and attempt < self.max_retries - 1:
+                retry_after = response.headers.get('Retry-After', '')
+                delay = float(retry_after) if retry_after.isdigit() else backoff
+                self._throttled_until = max(self._throttled_until, time.monotonic() + delay)
+                continue
+            return response
+    
+    def _check_cancelled(self):
+        """Raise if cancel_event has been set, so workers stop instead of sending more requests"""
+        if self.cancel_event.is_set():
+            raise Exception("Request cancelled")
+    
+    def _get_json(self, url: str, params: Dict = None) -> Dict:
+        """Make a request and return the decoded JSON body, raising on API errors"""
+        response = self._make_request(url, params)
+        if response.status_code != 200:
+            raise Exception(f"API Error: {response.status_code}\nResponse: {response.text}")
+        # Decode straight from bytes; orjson is used when installed
+        return _json_loads(response.content)
+    
+    def _cached(self, key, fetch, ttl: float = None):
+        """Return the cached response for key if it is still fresh, otherwise fetch and store it"""
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry and now - entry[0] < (self.cache_ttl if ttl is None else ttl):
+            return entry[1]
+        
+        value = fetch()
+        self._cache[key] = (now, value)
+        return value
+    
+    def clear_cache(self):
+        """Forget cached responses so the next lookups go to the API"""
+        self._cache.clear()
+    
+    def close(self):
+        """Close the pooled connections held by this client"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _iter_pages(self, url: str, params: Dict = None):
+        """Yield each page of a list endpoint, fetching the next page while the current one is processed"""
+        # Twilio pages are cursor-based (PageToken), so they can't be requested in parallel;
+        # instead the next page is already in flight while the caller parses this one
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(self._get_json, url, params)
+            while pending:
+                data = pending.result()
+                next_page_uri = data.get('next_page_uri')
+                if next_page_uri:
+                    self._check_cancelled()
+                    pending = prefetcher.submit(self._get_json, f'https://api.twilio.com{next_page_uri}')
+                else:
+                    pending = None
+                yield data
+                self._check_cancelled()
     
     def get_incoming_phone_numbers(self) -> List[Dict]:
         """Fetch all phone numbers in the account"""
+        return self._cached(('numbers',), self._fetch_incoming_phone_numbers, self.inventory_ttl)
+    
+    def _fetch_incoming_phone_numbers(self) -> List[Dict]:
         url = f'{self.base_url}/IncomingPhoneNumbers.json'
         all_numbers = []
+        fetched_at = time.monotonic()
         
-        while url:
-            response = self._make_request(url)
-            if response.status_code != 200:
-                raise Exception(f"API Error: {response.status_code}\nResponse: {response.text}")
-            
-            data = response.json()
+        for data in self._iter_pages(url, {'PageSize': 1000}):
             for num in data.get('incoming_phone_numbers', []):
+                # List entries carry the same fields as the single-number resource, so cache them as each
+                # number's config and selecting a number in the config tab needs no request of its own
+                self._cache[('number_config', num['sid'])] = (fetched_at, num)
                 all_numbers.append({
                     'phone_number': num['phone_number'],
                     'friendly_name': num['friendly_name'],
                     'sid': num['sid']
                 })
-            
-            url = data.get('next_page_uri')
-            if url:
-                url = f'https://api.twilio.com{url}'
         
         return all_numbers
     
     def get_phone_number_config(self, phone_number_sid: str) -> Dict:
         """Fetch configuration for a specific phone number"""
         url = f'{self.base_url}/IncomingPhoneNumbers/{phone_number_sid}.json'
-        
-        response = self._make_request(url)
-        if response.status_code != 200:
-            raise Exception(f"API Error: {response.status_code}\nResponse: {response.text}")
-        
-        return response.json()
+        return self._cached(('number_config', phone_number_sid), lambda: self._get_json(url), self.inventory_ttl)
     
-    def check_number_activity(self, phone_number: str, days: int) -> Dict:
-        """Check if a number has any calls or messages in the last X days"""
-        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        end_date = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        
-        # Check for calls TO the number (inbound)
-        calls = self._fetch_calls({'To': phone_number, 'StartTime>': cutoff_date, 'StartTime<': end_date})
-        
-        # Check for messages FROM the number (outbound)
-        messages = self._fetch_messages({'From': phone_number, 'DateSent>': cutoff_date, 'DateSent<': end_date})
-        
-        return {
-            'phone_number': phone_number,
-            'call_count': len(calls),
-            'message_count': len(messages),
-            'total_activity': len(calls) + len(messages),
-            'is_inactive': len(calls) + len(messages) == 0
-        }
+    def has_inbound_calls(self, phone_number: str, cutoff_date: str, end_date: str) -> bool:
+        """Check for any call TO the number between the two dates"""
+        return self._has_records(f'{self.base_url}/Calls.json', 'calls', {'To': phone_number, 'StartTime>': cutoff_date, 'StartTime<': end_date})
     
-    def get_calls(self, phone_number: str, start_date: str, end_date: str) -> List[Dict]:
-        """Fetch calls to and from a phone number"""
-        calls = []
-        
-        # Get calls TO the number
-        calls.extend(self._fetch_calls({'To': phone_number, 'StartTime>': start_date, 'StartTime<': end_date}))
-        
-        # Get calls FROM the number
-        calls.extend(self._fetch_calls({'From': phone_number, 'StartTime>': start_date, 'StartTime<': end_date}))
-        
-        # Sort by date
-        calls.sort(key=lambda x: x.get('sort_key', 0), reverse=True)
-        return calls
+    def has_outbound_messages(self, phone_number: str, cutoff_date: str, end_date: str) -> bool:
+        """Check for any message FROM the number between the two dates"""
+        return self._has_records(f'{self.base_url}/Messages.json', 'messages', {'From': phone_number, 'DateSent>': cutoff_date, 'DateSent<': end_date})
+    
+    def _has_records(self, url: str, key: str, params: Dict) -> bool:
+        """Probe a list endpoint with a one-row page instead of paging through every match"""
+        # Cached like other lookups, so re-running an inactive scan within cache_ttl sends no requests
+        cache_key = ('has_records', url, *sorted(params.items()))
+        return self._cached(cache_key, lambda: bool(self._get_json(url, {**params, 'PageSize': 1}).get(key)))
     
-    def _fetch_calls(self, params: Dict) -> List[Dict]:
-        """Fetch calls with pagination"""
+    def get_calls(self, phone_number: str, start_date: str, end_date: str, on_page=None) -> List[CallRow]:
+        """Fetch calls to and from a phone number, passing each page of rows to on_page as it arrives"""
+        return self._fetch_to_and_from(self._iter_call_pages, phone_number, 'StartTime', start_date, end_date, on_page)
+    
+    def _fetch_to_and_from(self, iter_pages, phone_number: str, date_field: str, start_date: str, end_date: str, on_page=None) -> List:
+        """Run the TO and FROM queries side by side and merge them, keeping one row per SID"""
+        # A number that calls or texts itself matches both queries
+        seen_sids = set()
+        lock = threading.Lock()
+        
+        def fetch(params):
+            # Twilio returns each query newest first, so each direction's rows form one sorted run
+            direction_rows = []
+            for page_rows in iter_pages(params):
+                with lock:
+                    new_rows = [row for row in page_rows if row.sid not in seen_sids]
+                    seen_sids.update(row.sid for row in new_rows)
+                direction_rows.extend(new_rows)
+                if on_page and new_rows:
+                    on_page(new_rows)
+            return direction_rows
+        
+        # TO and FROM queries are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(fetch, {direction: phone_number, f'{date_field}>': start_date, f'{date_field}<': end_date})
+                       for direction in ('To', 'From')]
+            rows = futures[0].result() + futures[1].result()
+        
+        # Sort by date - with the two runs kept apart instead of interleaved page by page,
+        # this is a single linear merge
+        rows.sort(key=attrgetter('sort_key'), reverse=True)
+        return rows
+    
+    def _iter_call_pages(self, params: Dict):
+        """Yield the rows of each page of calls as it arrives"""
         url = f'{self.base_url}/Calls.json'
-        all_calls = []
-        
         params['PageSize'] = 100
-        first_request = True
         
-        while url:
-            response = self._make_request(url, params if first_request else None)
-            first_request = False
-            
-            if response.status_code != 200:
-                raise Exception(f"API Error: {response.status_code}\nResponse: {response.text}")
-            
-            data = response.json()
+        for data in self._iter_pages(url, params):
+            page_calls = []
             for call in data.get('calls', []):
-                # Convert UTC timestamp to local time, preserving milliseconds
-                start_time_utc = call['start_time']
-                try:
-                    dt = datetime.strptime(start_time_utc, '%a, %d %b %Y %H:%M:%S %z')
-                    local_time = dt.astimezone().strftime('%Y-%m-%d %H:%M:%S')
-                    sort_key = dt.timestamp()  # Use Unix timestamp for precise sorting
-                except:
-                    local_time = start_time_utc
-                    sort_key = 0
+                # Convert UTC timestamp to local time; sort_key is the Unix timestamp for precise sorting
+                local_time, sort_key = _parse_twilio_timestamp(call['start_time'])
                 
-                all_calls.append({
-                    'direction': 'Outbound' if call['direction'].startswith('outbound') else 'Inbound',
-                    'from': call['from'],
-                    'to': call['to'],
-                    'start_time': local_time,
-                    'duration': call['duration'],
-                    'status': call['status'],
-                    'sid': call['sid'],
-                    'events_uri': call.get('subresource_uris', {}).get('events', ''),
-                    'sort_key': sort_key
-                })
+                page_calls.append(CallRow(
+                    'Outbound' if call['direction'].startswith('outbound') else 'Inbound',
+                    call['from'],
+                    call['to'],
+                    local_time,
+                    call['duration'],
+                    call['status'],
+                    call['sid'],
+                    sort_key,
+                    call.get('subresource_uris', {}).get('events', '')
+                ))
             
-            # Check for next page
-            url = data.get('next_page_uri')
-            if url:
-                url = f'https://api.twilio.com{url}'
-        
-        return all_calls
+            yield page_calls
     
     def get_call_events(self, call_sid: str) -> List[Dict]:
         """Fetch events for a specific call"""
         url = f'{self.base_url}/Calls/{call_sid}/Events.json'
-        
-        response = self._make_request(url)
-        if response.status_code != 200:
-            raise Exception(f"API Error: {response.status_code}\nResponse: {response.text}")
-        
-        data = response.json()
-        return data.get('events', [])
+        events = []
+        for data in self._iter_pages(url):
+            events.extend(data.get('events', []))
+        return events
+    
+    def get_call_details(self, call_sid: str) -> Dict:
+        """Fetch full details for a specific call"""
+        url = f'{self.base_url}/Calls/{call_sid}.json'
+        return self._cached(('call', call_sid), lambda: self._get_json(url))
     
     def get_message_details(self, message_sid: str) -> Dict:
         """Fetch full details for a specific message"""
         url = f'{self.base_url}/Messages/{message_sid}.json'
-        
-        response = self._make_request(url)
-        if response.status_code != 200:
-            raise Exception(f"API Error: {response.status_code}\nResponse: {response.text}")
-        
-        return response.json()
+        return self._cached(('message', message_sid), lambda: self._get_json(url))
     
-    def get_messages(self, phone_number: str, start_date: str, end_date: str) -> List[Dict]:
-        """Fetch messages to and from a phone number"""
-        messages = []
-        messages.extend(self._fetch_messages({'To': phone_number, 'DateSent>': start_date, 'DateSent<': end_date}))
-        messages.extend(self._fetch_messages({'From': phone_number, 'DateSent>': start_date, 'DateSent<': end_date}))
-        messages.sort(key=lambda x: x.get('sort_key', 0), reverse=True)
-        return messages
+    def get_messages(self, phone_number: str, start_date: str, end_date: str, on_page=None) -> List[MessageRow]:
+        """Fetch messages to and from a phone number, passing each page of rows to on_page as it arrives"""
+        return self._fetch_to_and_from(self._iter_message_pages, phone_number, 'DateSent', start_date, end_date, on_page)
     
-    def _fetch_messages(self, params: Dict) -> List[Dict]:
-        """Fetch messages with pagination"""
+    def _iter_message_pages(self, params: Dict):
+        """Yield the rows of each page of messages as it arrives"""
         url = f'{self.base_url}/Messages.json'
-        all_messages = []
         params['PageSize'] = 100
-        first_request = True
         
-        while url:
-            response = self._make_request(url, params if first_request else None)
-            first_request = False
-            
-            if response.status_code != 200:
-                raise Exception(f"API Error: {response.status_code}\nResponse: {response.text}")
-            
-            data = response.json()
+        for data in self._iter_pages(url, params):
+            page_messages = []
             for msg in data.get('messages', []):
-                # Convert UTC timestamp to local time, preserving milliseconds
-                date_sent_utc = msg['date_sent']
-                try:
-                    dt = datetime.strptime(date_sent_utc, '%a, %d %b %Y %H:%M:%S %z')
-                    local_time = dt.astimezone().strftime('%Y-%m-%d %H:%M:%S')
-                    sort_key = dt.timestamp()  # Use Unix timestamp for precise sorting
-                except:
-                    local_time = date_sent_utc
-                    sort_key = 0
+                # Convert UTC timestamp to local time; sort_key is the Unix timestamp for precise sorting
+                local_time, sort_key = _parse_twilio_timestamp(msg['date_sent'])
                 
-                # Replace newlines with space for grid display
-                body_text = msg['body'].replace('\n', ' ').replace('\r', '')
-                body_preview = body_text[:50] + '...' if len(body_text) > 50 else body_text
+                # Replace newlines with space for grid display; without a '\r' to drop, the translation
+                # keeps the length, so only the 50 previewed characters need translating
+                body = msg['body']
+                if '\r' in body:
+                    body = body.translate(_BODY_TR)
+                    body_preview = body[:50] + '...' if len(body) > 50 else body
+                else:
+                    body_preview = body[:50].translate(_BODY_TR) + '...' if len(body) > 50 else body.translate(_BODY_TR)
                 
-                all_messages.append({
-                    'direction': msg['direction'],  # Use actual direction from API
-                    'from': msg['from'],
-                    'to': msg['to'],
-                    'date_sent': local_time,
-                    'body': body_preview,
-                    'status': msg['status'],
-                    'sid': msg['sid'],
-                    'error_code': msg.get('error_code', ''),
-                    'error_message': msg.get('error_message', ''),
-                    'sort_key': sort_key
-                })
+                page_messages.append(MessageRow(
+                    msg['direction'],  # Use actual direction from API
+                    msg['from'],
+                    msg['to'],
+                    local_time,
+                    body_preview,
+                    msg['status'],
+                    msg['sid'],
+                    sort_key,
+                    msg.get('error_code', ''),
+                    msg.get('error_message', '')
+                ))
             
-            url = data.get('next_page_uri')
-            if url:
-                url = f'https://api.twilio.com{url}'
-        
-        return all_messages
+            yield page_messages
 
 class TwilioGUI:
+    # How each results column sorts; anything not listed sorts as text
+    COLUMN_TYPES = {
+        'Start Time': 'timestamp',
+        'Date Sent': 'timestamp',
+        'Duration (s)': 'number'
+    }
+    # Insert-time tags for each status tag; successful rows get no tag at all rather than an empty one
+    ROW_TAGS = {'': (), 'error': ('error',), 'warning': ('warning',)}
+    # Upper bound on concurrent activity queries when scanning for inactive numbers
+    INACTIVE_SCAN_WORKERS = 32
+    # Number of recent lookups kept in the phone dropdown and the history file
+    SEARCH_HISTORY_LIMIT = 20
+    # Account count above which substring searches go through a suffix index instead of a scan
+    SUFFIX_INDEX_MIN_ACCOUNTS = 500
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Twilio Manager")
@@ -304,13 +547,39 @@ class TwilioGUI:
         self.current_account = tk.StringVar()
         self.data_mode = tk.StringVar(value="calls")
         self.sort_reverse = {}  # Track sort direction per column
-        self.tree_data = {}  # Store hidden data like sort_key for each tree item
+        self.sort_column = None  # Column whose heading shows the sort arrow
+        self.config_numbers_account = None  # Account whose numbers fill the config tab dropdown
+        self.number_sid_map = {}
         self.all_data = []  # Store all fetched data for filtering
+        self.result_items = []  # Tree item IDs for all_data, in the same order (including filtered-out rows)
+        self.search_text = []  # Lowercase search text for all_data, in the same order
+        self._search_buffer = None  # search_text joined into one string with row start offsets, built on demand
+        self.visible_rows = []  # Indexes into all_data of the rows attached to the tree, in display order
+        self.filter_text = ''  # Filter text the attached rows were last narrowed to
+        self._filter_after_id = None  # Pending debounced filter
+        self._account_filter_after_id = None  # Pending debounced account-list filter
+        self._account_filter_text = ''  # Lowercase search text the account list was last filtered by
+        self._dropdown_filter_after_ids = {}  # Account combo -> its pending debounced dropdown filter
+        self._dropdown_filter_text = {}  # Account combo -> lowercase search text its values were last filtered by
         self.last_search = {}  # Store last search parameters
         self.search_history = []  # Store recent searches
+        self._history_set = set()  # The same numbers, for membership checks
+        self._history_after_id = None  # Pending debounced history write
+        self.fetch_in_progress = False
+        self._ui_queue = queue.Queue()  # Callbacks posted by worker threads, run on the Tk thread
+        self._api_cache = {}  # Account name -> TwilioAPI, so each account keeps one pooled session
+        self._closing = threading.Event()  # Set when the window closes; every client's cancel_event, so workers stop
+        self._tooltip = None  # Tooltip window shared by every widget, created on first hover
+        self.account_items = {}  # Account name -> its row in the account management tree, including filtered-out rows
+        self.account_item_names = {}  # The reverse: row -> account name
+        self._account_matches = OrderedDict()  # Recent account searches -> (matching names, their lowercase forms), most recent last
+        self._combo_values = {}  # Account combo -> the values tuple it was last given
+        self._suffix_index = None  # Sorted suffixes of the lowercase names and their account indices, built on demand
         
         self.setup_ui()
         self.load_search_history()
+        self.root.after(50, self.drain_ui_queue)
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
         
         # Prompt for initial import if no accounts exist
         if not self.config.accounts:
@@ -336,23 +605,24 @@ class TwilioGUI:
         config_frame = ttk.Frame(notebook)
         notebook.add(config_frame, text="Number Configuration")
         self.setup_config_tab(config_frame)
+        self.config_tab = config_frame
         
         # Tab 4: Account Management
         account_mgmt_frame = ttk.Frame(notebook)
         notebook.add(account_mgmt_frame, text="Account Management")
         self.setup_account_mgmt_tab(account_mgmt_frame)
         
-        # Refresh accounts after all tabs are created
+        # Refresh accounts after all tabs are created; later changes update both views in place
         self.refresh_accounts()
+        self.refresh_account_list()
     
     def on_tab_changed(self, event=None):
         """Sync account selection across tabs when switching"""
-        # Auto-load numbers for config tab if account is selected
-        if hasattr(self, 'config_account_combo') and self.current_account.get():
+        # Auto-load numbers when the config tab is opened, unless this account's are already listed
+        account_name = self.current_account.get()
+        if (hasattr(self, 'config_tab') and event and event.widget.select() == str(self.config_tab)
+                and account_name and account_name != self.config_numbers_account):
             self.load_numbers_for_config()
-        # Refresh account list in account management tab
-        if hasattr(self, 'accounts_tree'):
-            self.refresh_account_list()
     
     def setup_lookup_tab(self, parent):
         # Main container
@@ -373,7 +643,7 @@ class TwilioGUI:
         ttk.Label(account_frame, text="Search:").grid(row=0, column=1, padx=(20,5), sticky=tk.W)
         self.lookup_account_search = ttk.Entry(account_frame, width=20)
         self.lookup_account_search.grid(row=0, column=2, padx=5)
-        self.lookup_account_search.bind('<KeyRelease>', lambda e: self.filter_account_dropdown(self.account_combo, self.lookup_account_search, self.lookup_account_count))
+        self.lookup_account_search.bind('<KeyRelease>', lambda e: self.schedule_account_dropdown_filter(self.account_combo, self.lookup_account_search, self.lookup_account_count))
         
         self.account_combo = ttk.Combobox(account_frame, textvariable=self.current_account, width=50, state='readonly')
         self.account_combo.grid(row=0, column=3, padx=5)
@@ -410,7 +680,8 @@ class TwilioGUI:
         self.end_date.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
         self.end_date.set_date(datetime.now())
         
-        ttk.Button(query_frame, text="Fetch Data", command=self.fetch_data).grid(row=4, column=1, pady=10)
+        self.fetch_button = ttk.Button(query_frame, text="Fetch Data", command=self.fetch_data)
+        self.fetch_button.grid(row=4, column=1, pady=10)
         self.refresh_button = ttk.Button(query_frame, text="Refresh", command=self.refresh_data, state='disabled')
         self.refresh_button.grid(row=4, column=0, pady=10, padx=5, sticky=tk.E)
         ttk.Button(query_frame, text="Export CSV", command=self.export_csv).grid(row=4, column=2, pady=10, padx=5)
@@ -425,7 +696,8 @@ class TwilioGUI:
         
         self.filter_entry = ttk.Entry(filter_frame, width=20)
         self.filter_entry.pack(pady=5)
-        self.filter_entry.bind('<KeyRelease>', self.filter_results)
+        self.filter_entry.bind('<KeyRelease>', self.schedule_filter)
+        self.filter_entry.bind('<Return>', self.filter_results)  # Filter now rather than after the pause
         self.create_tooltip(self.filter_entry, "Search is case-insensitive and searches all visible fields")
         
         ttk.Button(filter_frame, text="Clear Filter", command=self.clear_filter).pack()
@@ -471,6 +743,11 @@ class TwilioGUI:
         # Status bar
         self.status_label = ttk.Label(main_frame, text="Ready", relief=tk.SUNKEN)
         self.status_label.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E))
+        
+        # Busy indicator while a fetch runs in the background
+        self.fetch_progress = ttk.Progressbar(main_frame, mode='indeterminate', length=150)
+        self.fetch_progress.grid(row=3, column=3, sticky=tk.E, padx=(10, 0))
+        self.fetch_progress.grid_remove()  # Hide initially
     
     def setup_inactive_tab(self, parent):
         # Main container
@@ -491,7 +768,7 @@ class TwilioGUI:
         ttk.Label(account_frame, text="Search:").grid(row=0, column=1, padx=(20,5), sticky=tk.W)
         self.inactive_account_search = ttk.Entry(account_frame, width=20)
         self.inactive_account_search.grid(row=0, column=2, padx=5)
-        self.inactive_account_search.bind('<KeyRelease>', lambda e: self.filter_account_dropdown(self.inactive_account_combo, self.inactive_account_search, self.inactive_account_count))
+        self.inactive_account_search.bind('<KeyRelease>', lambda e: self.schedule_account_dropdown_filter(self.inactive_account_combo, self.inactive_account_search, self.inactive_account_count))
         
         self.inactive_account_combo = ttk.Combobox(account_frame, textvariable=self.current_account, width=50, state='readonly')
         self.inactive_account_combo.grid(row=0, column=3, padx=5)
@@ -504,7 +781,11 @@ class TwilioGUI:
         self.inactive_days.set(30)
         self.inactive_days.grid(row=0, column=3, padx=5)
         
-        ttk.Button(account_frame, text="Find Inactive Numbers", command=self.find_inactive_numbers).grid(row=0, column=4, padx=5)
+        self.find_inactive_button = ttk.Button(account_frame, text="Find Inactive Numbers", command=self.find_inactive_numbers)
+        self.find_inactive_button.grid(row=0, column=4, padx=5)
+        
+        self.refresh_inactive_button = ttk.Button(account_frame, text="Refresh", command=self.refresh_inactive_numbers)
+        self.refresh_inactive_button.grid(row=0, column=5, padx=5)
         
         # Results
         results_frame = ttk.LabelFrame(main_frame, text="Inactive Numbers", padding="5")
@@ -555,7 +836,7 @@ class TwilioGUI:
         ttk.Label(select_frame, text="Search:").grid(row=0, column=1, padx=(20,5), pady=5, sticky=tk.W)
         self.config_account_search = ttk.Entry(select_frame, width=20)
         self.config_account_search.grid(row=0, column=2, padx=5, pady=5)
-        self.config_account_search.bind('<KeyRelease>', lambda e: self.filter_account_dropdown(self.config_account_combo, self.config_account_search, self.config_account_count))
+        self.config_account_search.bind('<KeyRelease>', lambda e: self.schedule_account_dropdown_filter(self.config_account_combo, self.config_account_search, self.config_account_count))
         
         self.config_account_combo = ttk.Combobox(select_frame, textvariable=self.current_account, width=50, state='readonly')
         self.config_account_combo.grid(row=0, column=3, padx=5, pady=5)
@@ -569,6 +850,7 @@ class TwilioGUI:
         self.config_number_combo.grid(row=0, column=3, padx=5, pady=5)
         
         ttk.Button(select_frame, text="Load Configuration", command=self.load_number_config).grid(row=0, column=4, padx=5, pady=5)
+        ttk.Button(select_frame, text="Refresh", command=self.refresh_number_config).grid(row=0, column=5, padx=5, pady=5)
         
         # Configuration Display
         config_display_frame = ttk.LabelFrame(main_frame, text="Configuration", padding="5")
@@ -641,7 +923,8 @@ class TwilioGUI:
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=5)
         self.account_search_entry = ttk.Entry(search_frame, width=40)
         self.account_search_entry.pack(side=tk.LEFT, padx=5)
-        self.account_search_entry.bind('<KeyRelease>', self.filter_accounts)
+        self.account_search_entry.bind('<KeyRelease>', self.schedule_account_filter)
+        self.account_search_entry.bind('<Return>', self.filter_accounts)
         ttk.Button(search_frame, text="Delete Selected", command=self.delete_selected_accounts).pack(side=tk.RIGHT, padx=5)
         
         columns = ('Name', 'SID')
@@ -664,21 +947,91 @@ class TwilioGUI:
     def create_tooltip(self, widget, text):
         """Create a tooltip for a widget"""
         def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = ttk.Label(tooltip, text=text, background="#ffffe0", relief=tk.SOLID, borderwidth=1, padding=5)
-            label.pack()
-            widget.tooltip = tooltip
+            # One window is reused for every tooltip: hovering only changes its text and position
+            # and shows it, instead of building and destroying a Toplevel each time
+            if self._tooltip is None:
+                self._tooltip = tk.Toplevel(self.root)
+                self._tooltip.wm_overrideredirect(True)
+                self._tooltip_label = ttk.Label(self._tooltip, background="#ffffe0", relief=tk.SOLID, borderwidth=1, padding=5)
+                self._tooltip_label.pack()
+            self._tooltip_label.config(text=text)
+            self._tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            self._tooltip.deiconify()
+            self._tooltip.lift()
         
         def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+            if self._tooltip is not None:
+                self._tooltip.withdraw()
         
         widget.bind('<Enter>', on_enter)
         widget.bind('<Leave>', on_leave)
     
+    def get_api(self, account_name):
+        """Return the shared API client for an account, creating it on first use"""
+        account = self.config.get_account(account_name)
+        if not account:
+            return None
+        
+        api = self._api_cache.get(account_name)
+        # Rebuild if the account was re-added with different credentials; the old client isn't closed
+        # here because a lookup or scan may still be using it, and its sockets close once it's collected
+        if not api or api.account_sid != account['account_sid'] or api.auth_token != account['auth_token']:
+            api = TwilioAPI(account['account_sid'], account['auth_token'], self._closing)
+            self._api_cache[account_name] = api
+        return api
+    
+    def subaccount_fetcher(self, sid, token):
+        """Return a function that lists the subaccounts these credentials can see, for run_in_background"""
+        # Reuse a saved account's client if the credentials match one
+        for api in self._api_cache.values():
+            if api.account_sid == sid and api.auth_token == token:
+                return api.get_subaccounts
+        
+        def fetch():
+            # Building a client loads the CA bundle, so the one-off client is created, and closed, on the worker
+            with TwilioAPI(sid, token, self._closing) as api:
+                return api.get_subaccounts()
+        return fetch
+    
+    def discard_api(self, account_name):
+        """Drop a deleted account's cached client, leaving any worker still using it to finish"""
+        self._api_cache.pop(account_name, None)
+    
+    def run_in_background(self, work, on_done, on_error):
+        """Run blocking work on a worker thread, then call on_done(result) or on_error(exception) on the Tk thread"""
+        def task():
+            try:
+                result = work()
+            except Exception as e:
+                self.post_to_ui(on_error, e)
+            else:
+                self.post_to_ui(on_done, result)
+        
+        threading.Thread(target=task, daemon=True).start()
+    
+    def post_to_ui(self, callback, *args):
+        """Queue a callback to run on the Tk thread (safe to call from worker threads)"""
+        self._ui_queue.put((callback, args))
+    
+    def drain_ui_queue(self):
+        """Run callbacks queued by worker threads"""
+        # Stop after a slice of work so a burst of queued pages can't hold up input and redraws;
+        # if callbacks are left over, come back as soon as Tk has handled its pending events
+        deadline = time.monotonic() + 0.03
+        delay = 50
+        try:
+            while True:
+                try:
+                    callback, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                callback(*args)
+                if time.monotonic() >= deadline:
+                    delay = 1
+                    break
+        finally:
+            self.root.after(delay, self.drain_ui_queue)
+    
     def on_account_changed(self, event=None):
         """Disable refresh when account changes"""
         if hasattr(self, 'last_search') and self.last_search:
@@ -691,21 +1044,42 @@ class TwilioGUI:
         history_path = Path.home() / '.twilio_gui_history.json'
         if history_path.exists():
             try:
-                with open(history_path, 'r') as f:
-                    self.search_history = json.load(f)
+                with open(history_path, 'rb') as f:
+                    self.search_history = _json_loads(f.read())[-self.SEARCH_HISTORY_LIMIT:]
             except:
                 self.search_history = []
+        self._history_set = set(self.search_history)
         self.update_phone_dropdown()
     
     def save_search_history(self):
-        """Save search history to config file"""
+        """Schedule a write of the search history, so a run of lookups writes the file once"""
+        if self._history_after_id:
+            self.root.after_cancel(self._history_after_id)
+        self._history_after_id = self.root.after(2000, self.flush_search_history)
+    
+    def flush_search_history(self):
+        """Write the search history to its file now"""
+        if self._history_after_id:
+            self.root.after_cancel(self._history_after_id)
+            self._history_after_id = None
+        
         history_path = Path.home() / '.twilio_gui_history.json'
+        tmp_path = history_path.with_name(history_path.name + '.tmp')
         try:
-            with open(history_path, 'w') as f:
-                json.dump(self.search_history[-20:], f)  # Keep last 20 searches
+            with open(tmp_path, 'w') as f:
+                json.dump(self.search_history, f)
+            os.replace(tmp_path, history_path)
         except:
             pass
     
+    def on_close(self):
+        """Write any pending search history before the window closes"""
+        # Worker pools aren't daemon threads, so stop their paging and queued requests or exit waits on them
+        self._closing.set()
+        if self._history_after_id:
+            self.flush_search_history()
+        self.root.destroy()
+    
     def update_phone_dropdown(self):
         """Update phone number dropdown with history"""
         if hasattr(self, 'phone_entry'):
@@ -715,6 +1089,7 @@ class TwilioGUI:
         """Clear search history"""
         if messagebox.askyesno("Confirm", "Clear all search history?"):
             self.search_history = []
+            self._history_set.clear()
             self.save_search_history()
             self.update_phone_dropdown()
             self.phone_entry.set('')
@@ -724,6 +1099,11 @@ class TwilioGUI:
         if not self.last_search:
             return  # Button should be disabled, but just in case
         
+        # An explicit refresh shouldn't be served from cached lookups
+        api = self.get_api(self.last_search.get('account', ''))
+        if api:
+            api.clear_cache()
+        
         # Restore last search parameters
         self.current_account.set(self.last_search.get('account', ''))
         self.data_mode.set(self.last_search.get('mode', 'calls'))
@@ -738,17 +1118,21 @@ class TwilioGUI:
         self.fetch_data()
     
     def refresh_accounts(self):
-        accounts = list(self.config.accounts.keys())
-        # Sort accounts alphabetically for easier browsing
-        accounts.sort()
+        # Sorted alphabetically for easier browsing; the config keeps the names in order
+        accounts = self.config.account_names
         self.all_accounts = accounts  # Store for filtering
-        self.account_combo['values'] = accounts
+        self.all_accounts_lower = [acc.lower() for acc in accounts]  # Lowercased once per change, not per keystroke
+        self._account_matches.clear()
+        self._suffix_index = None
+        self._dropdown_filter_text.clear()  # The combos are reset to every account below
+        values = tuple(accounts)  # One snapshot shared by every account combo
+        self.set_account_values(self.account_combo, values)
         if hasattr(self, 'inactive_account_combo'):
-            self.inactive_account_combo['values'] = accounts
+            self.set_account_values(self.inactive_account_combo, values)
             if not self.inactive_account_combo.get() and accounts:
                 self.inactive_account_combo.set(self.current_account.get())
         if hasattr(self, 'config_account_combo'):
-            self.config_account_combo['values'] = accounts
+            self.set_account_values(self.config_account_combo, values)
             if not self.config_account_combo.get() and accounts:
                 self.config_account_combo.set(self.current_account.get())
         if accounts and not self.current_account.get():
@@ -783,7 +1167,7 @@ class TwilioGUI:
                 return
             
             self.config.add_account(name, sid, token)
-            self.refresh_accounts()
+            self.accounts_changed(added=[name])
             self.current_account.set(name)
             dialog.destroy()
             messagebox.showinfo("Success", f"Account '{name}' added successfully")
@@ -798,7 +1182,8 @@ class TwilioGUI:
         
         if messagebox.askyesno("Confirm", f"Delete account '{account}'?"):
             self.config.delete_account(account)
-            self.refresh_accounts()
+            self.discard_api(account)
+            self.accounts_changed(removed=[account])
             messagebox.showinfo("Success", f"Account '{account}' deleted")
     
     def setup_tree_columns(self, mode):
@@ -815,21 +1200,17 @@ class TwilioGUI:
         for col in columns:
             self.tree.heading(col, text=col, command=lambda c=col: self.sort_tree_column(c))
             self.tree.column(col, width=150)
+        self.sort_column = None
     
     def get_status_tag(self, status, error_code=None):
         """Determine row color tag based on status"""
-        status_lower = status.lower() if status else ''
-        
-        # No color for success
-        if status_lower in ['delivered', 'completed', 'received']:
-            return ''
-        
-        # Red for errors
-        if error_code or status_lower in ['failed', 'canceled', 'busy', 'no-answer', 'undelivered']:
-            return 'error'
+        # Twilio sends statuses in lowercase, so the first lookup nearly always hits
+        tag = _STATUS_TAGS.get(status)
+        if tag is None:
+            tag = _STATUS_TAGS.get(status.lower() if status else '', 'warning')
         
-        # Yellow for all other statuses
-        return 'warning'
+        # An error code marks anything but a success as an error
+        return 'error' if error_code and tag else tag
     
     def show_context_menu(self, event):
         """Show right-click context menu"""
@@ -860,37 +1241,123 @@ class TwilioGUI:
         self.root.clipboard_append(value)
         self.status_label.config(text=f"Copied {field}: {value}")
     
+    @contextmanager
+    def bulk_update(self, tree):
+        """Hide a tree's columns while rows are changed in bulk so it lays out once at the end"""
+        tree.configure(displaycolumns=())
+        try:
+            yield
+        finally:
+            tree.configure(displaycolumns='#all')
+    
+    def populate_results(self, data, mode):
+        """Insert fetched rows into the results tree, attaching only those matching the current filter"""
+        insert = self.tree.insert
+        get_status_tag = self.get_status_tag
+        row_tags = self.ROW_TAGS
+        first = len(self.result_items)
+        with self.bulk_update(self.tree):
+            # Keep the loop down to the Tk calls; the bookkeeping is done in bulk afterwards.
+            # Only messages carry an error code, so read it by mode rather than probing each row
+            if mode == "calls":
+                new_items = [insert('', tk.END, values=row[:_VISIBLE_FIELDS], tags=row_tags[get_status_tag(row.status)])
+                             for row in data]
+            else:
+                new_items = [insert('', tk.END, values=row[:_VISIBLE_FIELDS], tags=row_tags[get_status_tag(row.status, row.error_code)])
+                             for row in data]
+            # Rows arriving while a filter is applied are checked against it like the rows already shown
+            if self.filter_text:
+                texts = self.search_text
+                filter_text = self.filter_text
+                dropped = [item for i, item in enumerate(new_items, first) if filter_text not in texts[i]]
+                if dropped:
+                    self.tree.detach(*dropped)
+                self.visible_rows.extend(i for i in range(first, first + len(data)) if filter_text in texts[i])
+            else:
+                self.visible_rows.extend(range(first, first + len(data)))
+        self.result_items.extend(new_items)
+    
+    def clear_results(self):
+        """Remove all results, including rows currently hidden by the filter"""
+        if self.result_items:
+            self.tree.delete(*self.result_items)
+        self.result_items = []
+        self.search_text = []
+        self._search_buffer = None
+        self.visible_rows = []
+        self.filter_text = ''
+        self.all_data = []
+    
+    def schedule_filter(self, event=None):
+        """Debounce filter typing so a burst of keystrokes filters only once"""
+        if self._filter_after_id:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(150, self.filter_results)
+    
     def filter_results(self, event=None):
         """Filter displayed results based on search text"""
-        search_text = self.filter_entry.get().lower()
+        if self._filter_after_id:
+            self.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
         
-        # Clear current display
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self.tree_data.clear()
+        search_text = self.filter_entry.get().lower()
         
-        # Re-populate with filtered data
-        mode = self.data_mode.get()
-        for item in self.all_data:
-            # Search in all visible fields
-            searchable = ' '.join(str(v).lower() for v in item.values() if v)
-            if search_text in searchable:
-                if mode == "calls":
-                    tag = self.get_status_tag(item['status'])
-                    item_id = self.tree.insert('', tk.END, values=(
-                        item['direction'], item['from'], item['to'],
-                        item['start_time'], item['duration'], item['status'], item['sid']
-                    ), tags=(tag,))
+        # Rows are inserted once at fetch time; filtering only changes which ones are attached
+        if self.filter_text in search_text:
+            # Typing more only narrows the last filter: recheck just the attached rows and detach
+            # the ones that stopped matching, which leaves the rest in their current order
+            texts = self.search_text
+            items = self.result_items
+            keep = []
+            dropped = []
+            for i in self.visible_rows:
+                if search_text in texts[i]:
+                    keep.append(i)
                 else:
-                    tag = self.get_status_tag(item['status'], item.get('error_code'))
-                    item_id = self.tree.insert('', tk.END, values=(
-                        item['direction'], item['from'], item['to'],
-                        item['date_sent'], item['body'], item['status'], item['sid']
-                    ), tags=(tag,))
-                self.tree_data[item_id] = {'sort_key': item.get('sort_key', 0)}
+                    dropped.append(items[i])
+            if dropped:
+                with self.bulk_update(self.tree):
+                    self.tree.detach(*dropped)
+            self.visible_rows = keep
+        else:
+            if search_text:
+                self.visible_rows = self.find_matching_rows(search_text)
+            else:
+                self.visible_rows = list(range(len(self.result_items)))
+            with self.bulk_update(self.tree):
+                self.tree.set_children('', *[self.result_items[i] for i in self.visible_rows])
+        self.filter_text = search_text
         
-        count = len(self.tree.get_children())
-        self.status_label.config(text=f"Showing {count} of {len(self.all_data)} {mode}")
+        mode = self.data_mode.get()
+        self.status_label.config(text=f"Showing {len(self.visible_rows)} of {len(self.all_data)} {mode}")
+    
+    def index_search_text(self, data):
+        """Store each row's lowercase search text so filtering doesn't rebuild it per keystroke"""
+        if not data:
+            return
+        # Lowercase the joined string once rather than per field
+        searched = _SEARCHED_FIELDS[type(data[0])]
+        self.search_text.extend(' '.join([str(v) for v in searched(row) if v]).lower() for row in data)
+        self._search_buffer = None
+    
+    def find_matching_rows(self, search_text):
+        """Return the indexes of the rows whose search text contains search_text, in order"""
+        # One find() sweep over all rows joined by newlines (which the filter entry can't contain,
+        # so a match never spans two rows) instead of a substring test per row
+        if self._search_buffer is None:
+            # Not accumulate(initial=0), which needs Python 3.8
+            offsets = [0]
+            offsets.extend(accumulate(len(text) + 1 for text in self.search_text))
+            self._search_buffer = ('\n'.join(self.search_text), offsets)
+        buffer, offsets = self._search_buffer
+        
+        rows = []
+        pos = buffer.find(search_text)
+        while pos != -1:
+            row = bisect_right(offsets, pos) - 1
+            rows.append(row)
+            pos = buffer.find(search_text, offsets[row + 1])  # Continue from the next row
+        return rows
     
     def clear_filter(self):
         """Clear filter and show all results"""
@@ -902,33 +1369,38 @@ class TwilioGUI:
         # Toggle sort direction for this column
         self.sort_reverse[col] = not self.sort_reverse.get(col, False)
         
-        items = []
-        for item_id in self.tree.get_children(''):
-            # For timestamp columns, use hidden sort_key if available
-            if col in ('Start Time', 'Date Sent') and item_id in self.tree_data:
-                sort_value = self.tree_data[item_id].get('sort_key', 0)
-            else:
-                sort_value = self.tree.set(item_id, col)
-            items.append((sort_value, item_id))
-        
-        # Try numeric sort, otherwise alphabetic
-        try:
-            items.sort(key=lambda x: float(x[0]) if x[0] else 0, reverse=self.sort_reverse[col])
-        except (ValueError, TypeError):
-            items.sort(reverse=self.sort_reverse[col])
-        
-        for index, (val, item_id) in enumerate(items):
-            self.tree.move(item_id, '', index)
-        
-        # Update column header to show sort direction
-        for column in self.tree['columns']:
-            current_text = column
-            if column == col:
-                arrow = ' ▼' if self.sort_reverse[col] else ' ▲'
-                current_text = column + arrow
-            self.tree.heading(column, text=current_text, command=lambda c=column: self.sort_tree_column(c))
+        # Sort the attached rows' indexes with keys from the fetched rows, whose fields are the tree's
+        # columns in order, instead of reading the children and a tree.set() per row back from Tcl
+        rows = self.all_data
+        index = list(self.tree['columns']).index(col)
+        column_type = self.COLUMN_TYPES.get(col, 'text')
+        if column_type == 'timestamp':
+            # Use the hidden Unix timestamp rather than the display string
+            def sort_key(i):
+                return rows[i].sort_key
+        elif column_type == 'number':
+            def sort_key(i):
+                value = str(rows[i][index])
+                return int(value) if value.isdigit() else 0
+        else:
+            def sort_key(i):
+                return str(rows[i][index])
+        
+        self.visible_rows.sort(key=sort_key, reverse=self.sort_reverse[col])
+        with self.bulk_update(self.tree):
+            self.tree.set_children('', *[self.result_items[i] for i in self.visible_rows])
+        
+        # Update column header to show sort direction; the sort commands stay bound from setup_tree_columns
+        if self.sort_column and self.sort_column != col:
+            self.tree.heading(self.sort_column, text=self.sort_column)
+        arrow = ' ▼' if self.sort_reverse[col] else ' ▲'
+        self.tree.heading(col, text=col + arrow)
+        self.sort_column = col
     
     def fetch_data(self):
+        if self.fetch_in_progress:
+            return
+        
         account_name = self.current_account.get()
         if not account_name:
             messagebox.showerror("Error", "Please select an account")
@@ -940,14 +1412,10 @@ class TwilioGUI:
             return
         
         # Auto-format phone number to E.164 if needed
-        if not phone.startswith('+'):
-            if len(phone) == 10:
-                phone = f'+1{phone}'
-            elif len(phone) == 11 and phone.startswith('1'):
-                phone = f'+{phone}'
-            else:
-                messagebox.showerror("Error", "Phone must be E.164 format (+19193736940) or 10 digits")
-                return
+        phone = _normalize_phone(phone)
+        if not phone:
+            messagebox.showerror("Error", "Phone must be E.164 format (+19193736940) or 10 digits")
+            return
         
         start = self.start_date.get_date().strftime('%Y-%m-%d')
         end = (self.end_date.get_date() + timedelta(days=1)).strftime('%Y-%m-%d')
@@ -965,70 +1433,97 @@ class TwilioGUI:
         }
         
         # Add to search history if not already there
-        if phone not in self.search_history:
+        if phone not in self._history_set:
             self.search_history.append(phone)
+            self._history_set.add(phone)
+            if len(self.search_history) > self.SEARCH_HISTORY_LIMIT:
+                self._history_set.difference_update(self.search_history[:-self.SEARCH_HISTORY_LIMIT])
+                del self.search_history[:-self.SEARCH_HISTORY_LIMIT]
             self.save_search_history()
             self.update_phone_dropdown()
         
         # Enable refresh button
         self.refresh_button.config(state='normal')
         
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self.tree_data.clear()
+        self.clear_results()
         
-        self.status_label.config(text=f"Fetching {mode}...")
-        self.root.update()
+        account = self.config.get_account(account_name)
+        if not account:
+            messagebox.showerror("Error", f"Account '{account_name}' not found")
+            return
         
-        try:
-            account = self.config.get_account(account_name)
-            if not account:
-                messagebox.showerror("Error", f"Account '{account_name}' not found")
-                return
-            
-            # Debug: verify credentials format
-            sid = account['account_sid']
-            token = account['auth_token']
-            
-            if not sid.startswith('AC') or len(sid) != 34:
-                self.show_error_dialog("Invalid Account SID", f"Account SID should start with 'AC' and be 34 characters.\nGot: {sid[:10]}... (length: {len(sid)})")
-                return
-            
-            if len(token) < 32:
-                self.show_error_dialog("Invalid Auth Token", f"Auth Token seems too short (length: {len(token)})")
-                return
+        # Debug: verify credentials format
+        sid = account['account_sid']
+        token = account['auth_token']
+        
+        if not _ACCOUNT_SID_RE.fullmatch(sid):
+            self.show_error_dialog("Invalid Account SID", f"Account SID should be 'AC' followed by 32 hex characters.\nGot: {sid[:10]}... (length: {len(sid)})")
+            return
+        
+        if len(token) < 32:
+            self.show_error_dialog("Invalid Auth Token", f"Auth Token seems too short (length: {len(token)})")
+            return
+        
+        api = self.get_api(account_name)
+        
+        def show_page(rows):
+            # Show each page as soon as it arrives instead of waiting for the whole result
+            self.index_search_text(rows)
+            self.all_data.extend(rows)  # Store for filtering
+            self.populate_results(rows, mode)
+            self.status_label.config(text=f"Fetching {mode}... {len(self.all_data)} so far")
+        
+        def fetch():
+            on_page = lambda rows: self.post_to_ui(show_page, rows)
+            if mode == "calls":
+                return api.get_calls(phone, start, end, on_page)
+            return api.get_messages(phone, start, end, on_page)
+        
+        def show_results(data):
+            self.finish_fetch()
             
-            api = TwilioAPI(sid, token)
+            # Pages from the TO and FROM queries arrive interleaved; data holds the same rows already
+            # in date order, so reorder the parallel lists to match it
+            position = {row.sid: i for i, row in enumerate(self.all_data)}
+            order = [position[row.sid] for row in data]
+            self.all_data = data
+            self.result_items = [self.result_items[i] for i in order]
+            self.search_text = [self.search_text[i] for i in order]
+            self._search_buffer = None
+            self.visible_rows = list(range(len(self.result_items)))
+            self.filter_text = ''
+            with self.bulk_update(self.tree):
+                self.tree.set_children('', *self.result_items)
             
-            if mode == "calls":
-                data = api.get_calls(phone, start, end)
-                self.all_data = data  # Store for filtering
-                for item in data:
-                    tag = self.get_status_tag(item['status'])
-                    item_id = self.tree.insert('', tk.END, values=(
-                        item['direction'], item['from'], item['to'],
-                        item['start_time'], item['duration'], item['status'], item['sid']
-                    ), tags=(tag,))
-                    self.tree_data[item_id] = {'sort_key': item.get('sort_key', 0)}
+            # Filter text typed while pages were streaming in still applies to the full result
+            if self.filter_entry.get():
+                self.filter_results()
+                result_text = f"Showing {len(self.visible_rows)} of {len(data)} {mode}"
             else:
-                data = api.get_messages(phone, start, end)
-                self.all_data = data  # Store for filtering
-                for item in data:
-                    tag = self.get_status_tag(item['status'], item.get('error_code'))
-                    item_id = self.tree.insert('', tk.END, values=(
-                        item['direction'], item['from'], item['to'],
-                        item['date_sent'], item['body'], item['status'], item['sid']
-                    ), tags=(tag,))
-                    self.tree_data[item_id] = {'sort_key': item.get('sort_key', 0)}
-            
-            result_text = f"Found {len(data)} {mode}"
+                result_text = f"Found {len(data)} {mode}"
             if len(data) >= 1000:
                 result_text += " (Large result - some data may not display. Try shorter date range)"
             self.status_label.config(text=result_text)
-            
-        except Exception as e:
+        
+        def show_error(e):
+            self.finish_fetch()
             self.show_error_dialog(f"Failed to fetch {mode}", str(e))
             self.status_label.config(text="Error")
+        
+        # Run the API calls off the Tk thread so the window stays responsive
+        self.fetch_in_progress = True
+        self.fetch_button.config(state='disabled')
+        self.fetch_progress.grid()
+        self.fetch_progress.start(10)
+        self.status_label.config(text=f"Fetching {mode}...")
+        self.run_in_background(fetch, show_results, show_error)
+    
+    def finish_fetch(self):
+        """Reset the lookup controls once a background fetch completes"""
+        self.fetch_in_progress = False
+        self.fetch_button.config(state='normal')
+        self.fetch_progress.stop()
+        self.fetch_progress.grid_remove()
     
     def show_error_dialog(self, title, message):
         """Show error in a copyable text dialog"""
@@ -1051,13 +1546,12 @@ class TwilioGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         text_widget.insert('1.0', message)
-        text_widget.config(state=tk.NORMAL)
         
         ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
     
     def export_csv(self):
         """Export current results to CSV"""
-        if not self.tree.get_children():
+        if not self.visible_rows:
             messagebox.showwarning("No Data", "No results to export. Fetch data first.")
             return
         
@@ -1070,21 +1564,30 @@ class TwilioGUI:
         if not filename:
             return
         
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+        # Write from the fetched rows rather than reading each one back out of the tree,
+        # keeping the tree's current filter and sort order; take them now, since a new lookup
+        # may replace the results while the file is being written
+        rows = [self.all_data[i] for i in self.visible_rows]
+        columns = self.tree['columns']
+        
+        def write_csv():
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 
                 # Write headers
-                writer.writerow(self.tree['columns'])
+                writer.writerow(columns)
                 
                 # Write data
-                for item in self.tree.get_children():
-                    writer.writerow(self.tree.item(item)['values'])
-            
-            messagebox.showinfo("Success", f"Exported {len(self.tree.get_children())} rows to {os.path.basename(filename)}")
-            
-        except Exception as e:
+                writer.writerows(row[:_VISIBLE_FIELDS] for row in rows)
+        
+        def show_done(result):
+            messagebox.showinfo("Success", f"Exported {len(rows)} rows to {os.path.basename(filename)}")
+        
+        def show_error(e):
             self.show_error_dialog("Export Failed", str(e))
+        
+        # Large exports are written on a worker thread so the window stays responsive
+        self.run_in_background(write_csv, show_done, show_error)
     
     def find_inactive_numbers(self):
         account_name = self.inactive_account_combo.get()
@@ -1098,55 +1601,139 @@ class TwilioGUI:
             messagebox.showerror("Error", "Invalid number of days")
             return
         
-        for item in self.inactive_tree.get_children():
-            self.inactive_tree.delete(item)
+        self.inactive_tree.delete(*self.inactive_tree.get_children())
         
-        self.inactive_status_label.config(text=f"Fetching phone numbers...")
-        self.root.update()
+        api = self.get_api(account_name)
+        if not api:
+            messagebox.showerror("Error", f"Account '{account_name}' not found")
+            return
         
-        try:
-            account = self.config.get_account(account_name)
-            if not account:
-                messagebox.showerror("Error", f"Account '{account_name}' not found")
-                return
-            
-            api = TwilioAPI(account['account_sid'], account['auth_token'])
-            
-            # Get all phone numbers
-            numbers = api.get_incoming_phone_numbers()
-            self.inactive_status_label.config(text=f"Checking {len(numbers)} numbers for activity...")
+        def show_progress(checked, total, phone_number):
+            self.inactive_status_label.config(text=f"Checked {checked}/{total}: {phone_number}")
+            self.inactive_progress['value'] = checked
+        
+        def start_progress(total):
+            self.inactive_status_label.config(text=f"Checking {total} numbers for activity...")
             
             # Show and configure progress bar
             self.inactive_progress.grid()
-            self.inactive_progress['maximum'] = len(numbers)
+            self.inactive_progress['maximum'] = total
             self.inactive_progress['value'] = 0
-            self.root.update()
+        
+        def add_inactive_rows(rows):
+            with self.bulk_update(self.inactive_tree):
+                for values in rows:
+                    self.inactive_tree.insert('', tk.END, values=values)
+        
+        def scan():
+            # Runs on a worker thread; all widget updates go through post_to_ui
+            numbers = api.get_incoming_phone_numbers()
+            self.post_to_ui(start_progress, len(numbers))
+            
+            now = datetime.now()
+            cutoff_date = (now - timedelta(days=days)).strftime('%Y-%m-%d')
+            end_date = (now + timedelta(days=1)).strftime('%Y-%m-%d')
             
             inactive_count = 0
-            for i, num in enumerate(numbers):
-                self.inactive_status_label.config(text=f"Checking {i+1}/{len(numbers)}: {num['phone_number']}")
-                self.inactive_progress['value'] = i + 1
-                self.root.update()
-                
-                activity = api.check_number_activity(num['phone_number'], days)
+            pending_rows = []
+            last_progress = 0
+            # Each number needs two independent queries (calls in, messages out); all of them
+            # share one pool instead of every number starting its own pair of threads
+            workers = max(1, min(self.INACTIVE_SCAN_WORKERS, 2 * len(numbers)))
+            
+            def run_probe(probe_activity, phone_number):
+                # Queued probes still start after the window closes unless they check first
+                if self._closing.is_set():
+                    raise Exception("Scan cancelled")
+                return probe_activity(phone_number, cutoff_date, end_date)
+            
+            # Not a with block: its exit would wait on every queued probe, which would hold up closing the app
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = {}
+                probes = {}  # Number SID -> its queries
+                # Queue every calls query ahead of the messages queries, so a number whose calls
+                # query finds activity usually still has its messages query waiting to be cancelled
+                for probe_activity in (api.has_inbound_calls, api.has_outbound_messages):
+                    for num in numbers:
+                        if self._closing.is_set():
+                            break
+                        probe = executor.submit(run_probe, probe_activity, num['phone_number'])
+                        probes.setdefault(num['sid'], []).append(probe)
+                        futures[probe] = num
                 
-                if activity['is_inactive']:
-                    self.inactive_tree.insert('', tk.END, values=(
-                        activity['phone_number'],
-                        num['friendly_name'],
-                        activity['call_count'],
-                        activity['message_count'],
-                        activity['total_activity']
-                    ))
-                    inactive_count += 1
+                quiet = {}  # Number SID -> queries answered so far, all of which found nothing
+                decided = set()  # Number SIDs already known to be active or inactive
+                checked = 0
+                try:
+                    for future in as_completed(futures):
+                        if self._closing.is_set():
+                            raise Exception("Scan cancelled")
+                        num = futures[future]
+                        if num['sid'] in decided:
+                            continue  # Settled by its other query; this one may have been cancelled
+                        
+                        if future.result():
+                            # Any activity makes the number active, so its other query isn't needed
+                            # if it hasn't started yet
+                            for probe in probes[num['sid']]:
+                                probe.cancel()
+                        else:
+                            quiet[num['sid']] = quiet.get(num['sid'], 0) + 1
+                            if quiet[num['sid']] < 2:
+                                continue
+                            # Only numbers with no activity are listed, so their counts are all zero
+                            pending_rows.append((num['phone_number'], num['friendly_name'], 0, 0, 0))
+                            inactive_count += 1
+                        decided.add(num['sid'])
+                        checked += 1
+                        
+                        # Checks finish in bursts; redraw the progress and flush new rows at most every 100ms, plus at the end
+                        now = time.monotonic()
+                        if now - last_progress >= 0.1 or checked == len(numbers):
+                            last_progress = now
+                            self.post_to_ui(show_progress, checked, len(numbers), num['phone_number'])
+                            if pending_rows:
+                                self.post_to_ui(add_inactive_rows, pending_rows)
+                                pending_rows = []
+                except Exception:
+                    # Don't wait on checks that haven't started yet, but keep the rows already found
+                    for pending in futures:
+                        pending.cancel()
+                    if pending_rows:
+                        self.post_to_ui(add_inactive_rows, pending_rows)
+                    raise
+            finally:
+                # Every probe has finished or been cancelled by now, apart from those running when a scan failed
+                executor.shutdown(wait=False)
             
-            self.inactive_status_label.config(text=f"Found {inactive_count} inactive numbers (out of {len(numbers)} total)")
+            return inactive_count, len(numbers)
+        
+        def show_summary(result):
+            inactive_count, total = result
+            self.find_inactive_button.config(state='normal')
+            self.refresh_inactive_button.config(state='normal')
+            self.inactive_status_label.config(text=f"Found {inactive_count} inactive numbers (out of {total} total)")
             self.inactive_progress.grid_remove()  # Hide progress bar when done
-            
-        except Exception as e:
+        
+        def show_error(e):
+            self.find_inactive_button.config(state='normal')
+            self.refresh_inactive_button.config(state='normal')
             self.inactive_progress.grid_remove()
             self.show_error_dialog("Error Finding Inactive Numbers", str(e))
             self.inactive_status_label.config(text="Error")
+        
+        self.find_inactive_button.config(state='disabled')
+        self.refresh_inactive_button.config(state='disabled')
+        self.inactive_status_label.config(text=f"Fetching phone numbers...")
+        self.run_in_background(scan, show_summary, show_error)
+    
+    def refresh_inactive_numbers(self):
+        """Drop the selected account's cached numbers and activity probes, then scan again"""
+        api = self.get_api(self.inactive_account_combo.get())
+        if api:
+            api.clear_cache()
+        self.find_inactive_numbers()
     
     def load_numbers_for_config(self, event=None):
         """Load phone numbers when account is selected"""
@@ -1154,29 +1741,42 @@ class TwilioGUI:
         if not account_name:
             return
         
-        self.config_status_label.config(text="Loading phone numbers...")
-        self.root.update()
+        api = self.get_api(account_name)
+        if not api:
+            self.config_status_label.config(text="Account not found")
+            return
         
-        try:
-            account = self.config.get_account(account_name)
-            if not account:
-                self.config_status_label.config(text="Account not found")
-                return
-            
-            api = TwilioAPI(account['account_sid'], account['auth_token'])
-            numbers = api.get_incoming_phone_numbers()
-            
-            # Store numbers with their SIDs
-            self.number_sid_map = {f"{num['phone_number']} ({num['friendly_name']})": num['sid'] for num in numbers}
-            self.config_number_combo['values'] = list(self.number_sid_map.keys())
-            
-            self.config_status_label.config(text=f"Loaded {len(numbers)} phone numbers")
-            return True
-            
-        except Exception as e:
+        def show_numbers(numbers):
+            # Ignore results for an account that's no longer selected
+            if self.config_account_combo.get() == account_name:
+                self.set_config_numbers(account_name, numbers)
+        
+        def show_error(e):
             self.show_error_dialog("Error Loading Numbers", str(e))
             self.config_status_label.config(text="Error")
-            return False
+        
+        self.config_status_label.config(text="Loading phone numbers...")
+        self.run_in_background(api.get_incoming_phone_numbers, show_numbers, show_error)
+    
+    def refresh_number_config(self):
+        """Drop cached numbers and config for the selected account and load them again"""
+        api = self.get_api(self.config_account_combo.get())
+        if not api:
+            return
+        api.clear_cache()
+        
+        self.load_numbers_for_config()
+        if self.config_number_combo.get():
+            self.load_number_config()
+    
+    def set_config_numbers(self, account_name, numbers):
+        """Fill the config tab's number dropdown"""
+        self.config_numbers_account = account_name
+        # Store numbers with their SIDs
+        self.number_sid_map = {f"{num['phone_number']} ({num['friendly_name']})": num['sid'] for num in numbers}
+        self.config_number_combo['values'] = list(self.number_sid_map.keys())
+        
+        self.config_status_label.config(text=f"Loaded {len(numbers)} phone numbers")
     
     def load_number_config(self):
         """Load and display configuration for selected number"""
@@ -1191,61 +1791,49 @@ class TwilioGUI:
             messagebox.showerror("Error", "Please select a phone number")
             return
         
-        if not hasattr(self, 'number_sid_map') or number_display not in self.number_sid_map:
-            # Try to load numbers first
-            self.load_numbers_for_config()
-            if not hasattr(self, 'number_sid_map') or number_display not in self.number_sid_map:
-                messagebox.showerror("Error", "Failed to load phone numbers")
-                return
-        
-        phone_sid = self.number_sid_map[number_display]
+        phone_sid = None
+        if account_name == self.config_numbers_account:
+            phone_sid = self.number_sid_map.get(number_display)
         
-        self.config_status_label.config(text="Loading configuration...")
-        self.root.update()
+        api = self.get_api(account_name)
+        if not api:
+            messagebox.showerror("Error", f"Account '{account_name}' not found")
+            return
         
-        try:
-            account = self.config.get_account(account_name)
-            api = TwilioAPI(account['account_sid'], account['auth_token'])
-            
-            config = api.get_phone_number_config(phone_sid)
+        def load_config():
+            sid = phone_sid
+            if not sid:
+                # Numbers weren't loaded yet - fetch them first, then the config, in the same worker
+                numbers = api.get_incoming_phone_numbers()
+                self.post_to_ui(self.set_config_numbers, account_name, numbers)
+                sid = next((num['sid'] for num in numbers if f"{num['phone_number']} ({num['friendly_name']})" == number_display), None)
+                if not sid:
+                    raise Exception("Failed to load phone numbers")
+            return api.get_phone_number_config(sid)
+        
+        def show_config(config):
+            # Ignore a slow response for a number that's no longer selected
+            if self.config_number_combo.get() != number_display:
+                return
             
             # Display configuration in readable format
-            self.config_text.delete('1.0', tk.END)
-            
-            # Key configuration fields
-            fields = [
-                ('Phone Number', 'phone_number'),
-                ('Friendly Name', 'friendly_name'),
-                ('SID', 'sid'),
-                ('Voice URL', 'voice_url'),
-                ('Voice Method', 'voice_method'),
-                ('Voice Fallback URL', 'voice_fallback_url'),
-                ('Status Callback URL', 'status_callback'),
-                ('SMS URL', 'sms_url'),
-                ('SMS Method', 'sms_method'),
-                ('SMS Fallback URL', 'sms_fallback_url'),
-                ('Capabilities - Voice', 'capabilities.voice'),
-                ('Capabilities - SMS', 'capabilities.sms'),
-                ('Capabilities - MMS', 'capabilities.mms'),
-                ('Emergency Enabled', 'emergency_status'),
-                ('Trunk SID', 'trunk_sid'),
-                ('Voice Application SID', 'voice_application_sid'),
-                ('SMS Application SID', 'sms_application_sid')
-            ]
-            
-            for label, key in fields:
-                value = config
-                for k in key.split('.'):
-                    value = value.get(k, '') if isinstance(value, dict) else ''
-                
+            parts = []
+            for label, path in _CONFIG_FIELDS:
+                value = _dig(config, path)
                 if value:
-                    self.config_text.insert(tk.END, f"{label}:\n  {value}\n\n")
+                    parts.append(f"{label}:\n  {value}\n\n")
             
-            self.config_status_label.config(text="Configuration loaded")
+            # One replace instead of a clear plus an insert per field
+            self.config_text.replace('1.0', tk.END, ''.join(parts))
             
-        except Exception as e:
+            self.config_status_label.config(text="Configuration loaded")
+        
+        def show_error(e):
             self.show_error_dialog("Error Loading Configuration", str(e))
             self.config_status_label.config(text="Error")
+        
+        self.config_status_label.config(text="Loading configuration...")
+        self.run_in_background(load_config, show_config, show_error)
     
     def show_call_message_events(self, event):
         """Show events for selected call or message"""
@@ -1280,76 +1868,140 @@ class TwilioGUI:
         events_frame = ttk.Frame(dialog, padding="10")
         events_frame.pack(fill=tk.BOTH, expand=True)
         
-        text_widget = tk.Text(events_frame, wrap=tk.WORD)
-        scrollbar = ttk.Scrollbar(events_frame, command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
+        if mode == "calls":
+            # One lightweight row per event; the full request/response is only rendered for the selected one
+            summary_label = ttk.Label(info_frame, text="Loading events...")
+            summary_label.pack()
+            
+            panes = ttk.PanedWindow(events_frame, orient=tk.VERTICAL)
+            panes.pack(fill=tk.BOTH, expand=True)
+            
+            list_frame = ttk.Frame(panes)
+            events_tree = ttk.Treeview(list_frame, columns=('Event', 'Timestamp', 'Request URL', 'Method', 'Response'), show='headings', height=10)
+            for col, width in (('Event', 120), ('Timestamp', 170), ('Request URL', 320), ('Method', 70), ('Response', 80)):
+                events_tree.heading(col, text=col)
+                events_tree.column(col, width=width)
+            tree_scrollbar = ttk.Scrollbar(list_frame, command=events_tree.yview)
+            events_tree.configure(yscrollcommand=tree_scrollbar.set)
+            events_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            panes.add(list_frame, weight=3)
+            
+            detail_frame = ttk.Frame(panes)
+            text_widget = tk.Text(detail_frame, wrap=tk.WORD, height=8)
+            scrollbar = ttk.Scrollbar(detail_frame, command=text_widget.yview)
+            text_widget.configure(yscrollcommand=scrollbar.set)
+            text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            panes.add(detail_frame, weight=2)
+            
+            event_rows = {}  # Tree item -> event
+            
+            def show_event_detail(e=None):
+                selection = events_tree.selection()
+                if selection:
+                    text_widget.replace('1.0', tk.END, json.dumps(event_rows[selection[0]], indent=2))
+            
+            events_tree.bind('<<TreeviewSelect>>', show_event_detail)
+        else:
+            text_widget = tk.Text(events_frame, wrap=tk.WORD)
+            scrollbar = ttk.Scrollbar(events_frame, command=text_widget.yview)
+            text_widget.configure(yscrollcommand=scrollbar.set)
+            
+            text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            text_widget.insert('1.0', "Loading events...\n")
         
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
         
-        text_widget.insert('1.0', "Loading events...\n")
-        dialog.update()
+        api = self.get_api(account_name)
         
-        try:
-            account = self.config.get_account(account_name)
-            api = TwilioAPI(account['account_sid'], account['auth_token'])
+        def load_events():
+            if mode == "calls":
+                # The call record and its events are separate requests; fetch them together
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    details_future = executor.submit(api.get_call_details, sid)
+                    events_future = executor.submit(api.get_call_events, sid)
+                    return details_future.result(), events_future.result()
+            return api.get_message_details(sid)
+        
+        def show_call_events(call_details, events):
+            summary = f"Duration: {call_details.get('duration', 'N/A')}s  |  Start: {call_details.get('start_time', 'N/A')}  |  End: {call_details.get('end_time', 'N/A')}"
+            if call_details.get('price'):
+                summary += f"  |  Price: {call_details.get('price')} {call_details.get('price_unit', '')}"
+            summary_label.config(text=summary)
+            
+            if not events:
+                text_widget.insert('1.0', "No events found for this call.\n")
+                return
+            
+            with self.bulk_update(events_tree):
+                for event in events:
+                    request = event.get('request') or {}
+                    response = event.get('response') or {}
+                    item_id = events_tree.insert('', tk.END, values=(
+                        event.get('name', 'Unknown'), event.get('timestamp', 'N/A'),
+                        request.get('url', ''), request.get('method', ''), response.get('status_code', '')
+                    ))
+                    event_rows[item_id] = event
+            text_widget.insert('1.0', "Select an event to see its full request and response.\n")
+        
+        def show_events(result):
+            if not dialog.winfo_exists():
+                return
             
             if mode == "calls":
-                events = api.get_call_events(sid)
-                
-                text_widget.delete('1.0', tk.END)
-                
-                if not events:
-                    text_widget.insert(tk.END, "No events found for this call.\n")
-                else:
-                    for event in events:
-                        text_widget.insert(tk.END, f"Event: {event.get('name', 'Unknown')}\n")
-                        text_widget.insert(tk.END, f"Timestamp: {event.get('timestamp', 'N/A')}\n")
-                        if event.get('request'):
-                            text_widget.insert(tk.END, f"Request: {event['request'].get('url', 'N/A')}\n")
-                            text_widget.insert(tk.END, f"Method: {event['request'].get('method', 'N/A')}\n")
-                        if event.get('response'):
-                            text_widget.insert(tk.END, f"Response Status: {event['response'].get('status_code', 'N/A')}\n")
-                        text_widget.insert(tk.END, "\n" + "-"*80 + "\n\n")
-            else:
-                # For messages, show full message details
-                msg_details = api.get_message_details(sid)
-                
-                text_widget.delete('1.0', tk.END)
-                
-                text_widget.insert(tk.END, f"Message SID: {sid}\n\n")
-                text_widget.insert(tk.END, f"Direction: {msg_details.get('direction', 'N/A')}\n")
-                text_widget.insert(tk.END, f"From: {msg_details.get('from', 'N/A')}\n")
-                text_widget.insert(tk.END, f"To: {msg_details.get('to', 'N/A')}\n")
-                text_widget.insert(tk.END, f"Date Sent: {msg_details.get('date_sent', 'N/A')}\n")
-                text_widget.insert(tk.END, f"Date Updated: {msg_details.get('date_updated', 'N/A')}\n")
-                text_widget.insert(tk.END, f"Status: {msg_details.get('status', 'N/A')}\n\n")
-                
-                # Full message body
-                text_widget.insert(tk.END, f"Message Body:\n{msg_details.get('body', 'N/A')}\n\n")
-                
-                # Error info if present
-                if msg_details.get('error_code'):
-                    text_widget.insert(tk.END, f"ERROR CODE: {msg_details.get('error_code')}\n")
-                    text_widget.insert(tk.END, f"ERROR MESSAGE: {msg_details.get('error_message', 'N/A')}\n\n")
-                
-                # Pricing
-                if msg_details.get('price'):
-                    text_widget.insert(tk.END, f"Price: {msg_details.get('price')} {msg_details.get('price_unit', '')}\n")
-                
-                # Segments (for long SMS)
-                if msg_details.get('num_segments'):
-                    text_widget.insert(tk.END, f"Segments: {msg_details.get('num_segments')}\n")
-                
-                # Media (MMS)
-                if msg_details.get('num_media') and int(msg_details.get('num_media', 0)) > 0:
-                    text_widget.insert(tk.END, f"\nMedia Attachments: {msg_details.get('num_media')}\n")
+                show_call_events(*result)
+                return
+            
+            # For messages, show full message details; build the report and write it with a single insert
+            msg_details = result
+            parts = []
+            
+            parts.append(f"Message SID: {sid}\n\n")
+            parts.append(f"Direction: {msg_details.get('direction', 'N/A')}\n")
+            parts.append(f"From: {msg_details.get('from', 'N/A')}\n")
+            parts.append(f"To: {msg_details.get('to', 'N/A')}\n")
+            parts.append(f"Date Sent: {msg_details.get('date_sent', 'N/A')}\n")
+            parts.append(f"Date Updated: {msg_details.get('date_updated', 'N/A')}\n")
+            parts.append(f"Status: {msg_details.get('status', 'N/A')}\n\n")
+            
+            # Full message body
+            parts.append(f"Message Body:\n{msg_details.get('body', 'N/A')}\n\n")
+            
+            # Error info if present
+            error_code = msg_details.get('error_code')
+            if error_code:
+                parts.append(f"ERROR CODE: {error_code}\n")
+                parts.append(f"ERROR MESSAGE: {msg_details.get('error_message', 'N/A')}\n\n")
+            
+            # Pricing
+            price = msg_details.get('price')
+            if price:
+                parts.append(f"Price: {price} {msg_details.get('price_unit', '')}\n")
+            
+            # Segments (for long SMS)
+            num_segments = msg_details.get('num_segments')
+            if num_segments:
+                parts.append(f"Segments: {num_segments}\n")
+            
+            # Media (MMS)
+            num_media = msg_details.get('num_media')
+            if num_media and int(num_media) > 0:
+                parts.append(f"\nMedia Attachments: {num_media}\n")
+            
+            # Swap the loading text for the report in one Tk call
+            text_widget.replace('1.0', tk.END, ''.join(parts))
         
-        except Exception as e:
-            text_widget.delete('1.0', tk.END)
-            text_widget.insert(tk.END, f"Error loading events:\n\n{str(e)}")
+        def show_error(e):
+            if not dialog.winfo_exists():
+                return
+            if mode == "calls":
+                summary_label.config(text="Error")
+            text_widget.replace('1.0', tk.END, f"Error loading events:\n\n{str(e)}")
         
-        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
+        self.run_in_background(load_events, show_events, show_error)
     
     def fetch_accounts_for_import(self):
         """Fetch accounts from Twilio API for import"""
@@ -1361,31 +2013,26 @@ class TwilioGUI:
             return
         
         # Clear previous results
-        for item in self.import_tree.get_children():
-            self.import_tree.delete(item)
-        
-        self.account_mgmt_status.config(text="Fetching accounts from Twilio...")
-        self.root.update()
+        self.import_tree.delete(*self.import_tree.get_children())
         
-        try:
-            api = TwilioAPI(sid, token)
-            accounts = api.get_subaccounts()
+        def show_accounts(accounts):
+            # Store fetched accounts for import; each row's item id is its account SID
+            self.fetched_accounts = {acc['sid']: acc for acc in accounts}
             
-            # Store fetched accounts for import
-            self.fetched_accounts = {}
-            
-            for acc in accounts:
-                name = acc['friendly_name'] or acc['sid']
-                item_id = self.import_tree.insert('', tk.END, values=(
-                    name, acc['sid'], acc['type']
-                ))
-                self.fetched_accounts[item_id] = acc
+            rows = tuple((acc['sid'], acc['friendly_name'] or acc['sid'], acc['sid'], acc['type']) for acc in accounts)
+            with self.bulk_update(self.import_tree):
+                # Clear again in case an earlier fetch finished since this one started
+                self.import_tree.delete(*self.import_tree.get_children())
+                self.import_tree.tk.call('apply', _TREE_BULK_INSERT, str(self.import_tree), rows)
             
             self.account_mgmt_status.config(text=f"Found {len(accounts)} accounts")
-            
-        except Exception as e:
-            self.show_error_dialog("Failed to fetch accounts", str(e))
+        
+        def show_error(e):
             self.account_mgmt_status.config(text="Error")
+            self.show_error_dialog("Failed to fetch accounts", str(e))
+        
+        self.account_mgmt_status.config(text="Fetching accounts from Twilio...")
+        self.run_in_background(self.subaccount_fetcher(sid, token), show_accounts, show_error)
     
     def import_selected_accounts(self):
         """Import selected accounts from the fetched list"""
@@ -1394,11 +2041,10 @@ class TwilioGUI:
             messagebox.showwarning("No Selection", "Please select accounts to import")
             return
         
-        imported = 0
+        new_accounts = []
         skipped = 0
         
-        # Get existing SIDs
-        existing_sids = {details['account_sid'] for details in self.config.accounts.values()}
+        existing_sids = self.config.account_sids
         
         for item_id in selection:
             if item_id in self.fetched_accounts:
@@ -1410,37 +2056,91 @@ class TwilioGUI:
                     continue
                 
                 name = acc['friendly_name'] or acc['sid']
-                self.config.add_account(name, acc['sid'], acc['auth_token'])
-                imported += 1
+                new_accounts.append((name, acc['sid'], acc['auth_token']))
         
-        self.refresh_accounts()
-        self.refresh_account_list()
+        # One config write for the whole selection
+        self.config.add_accounts(new_accounts)
+        imported = len(new_accounts)
+        
+        self.accounts_changed(added=[name for name, _, _ in new_accounts])
         
-        msg = f"Imported {imported} account(s)"
+        status = f"Imported {imported} account(s)"
         if skipped > 0:
-            msg += f" ({skipped} skipped - already exist)"
-        messagebox.showinfo("Import Complete", msg)
-        self.account_mgmt_status.config(text=msg)
+            status += f" ({skipped} skipped - already exist)"
+        # Update the label before the modal dialog so it redraws along with the account list
+        self.account_mgmt_status.config(text=status)
+        messagebox.showinfo("Import Complete", status)
     
     def refresh_account_list(self):
         """Refresh the current accounts list in account management tab"""
         if not hasattr(self, 'accounts_tree'):
             return
         
-        for item in self.accounts_tree.get_children():
-            self.accounts_tree.delete(item)
-        
-        search_text = self.account_search_entry.get().lower() if hasattr(self, 'account_search_entry') else ''
+        # Rows are inserted for every account; the search box only changes which ones are attached
+        tree = self.accounts_tree
+        rows = tuple((f'acct{i}', name, details['account_sid'])
+                     for i, (name, details) in enumerate(self.config.accounts.items()))
+        with self.bulk_update(tree):
+            if self.account_items:
+                tree.delete(*self.account_items.values())
+            tree.tk.call('apply', _TREE_BULK_INSERT, str(tree), rows)
+        self.account_items = {name: item_id for item_id, name, _ in rows}
+        self.account_item_names = {item_id: name for item_id, name, _ in rows}
+        self.filter_accounts()
+    
+    def accounts_changed(self, added=(), removed=()):
+        """Update the account combos and the management list after accounts were added or removed"""
+        self.refresh_accounts()
+        if not hasattr(self, 'accounts_tree'):
+            return
         
-        for name, details in self.config.accounts.items():
-            # Only search name, not SID
-            if search_text and search_text not in name.lower():
-                continue
-            self.accounts_tree.insert('', tk.END, values=(name, details['account_sid']))
+        # Only the changed rows are touched; everything else keeps its tree item
+        tree = self.accounts_tree
+        accounts = self.config.accounts
+        with self.bulk_update(tree):
+            gone = [self.account_items.pop(name) for name in removed if name in self.account_items]
+            if gone:
+                tree.delete(*gone)
+                for item_id in gone:
+                    del self.account_item_names[item_id]
+            for name in added:
+                values = (name, accounts[name]['account_sid'])
+                item_id = self.account_items.get(name)
+                if item_id:
+                    tree.item(item_id, values=values)
+                else:
+                    item_id = tree.insert('', tk.END, values=values)
+                    self.account_items[name] = item_id
+                    self.account_item_names[item_id] = name
+        self.filter_accounts()
+    
+    def schedule_account_filter(self, event=None):
+        """Debounce account search typing so a burst of keystrokes rebuilds the list only once"""
+        if self._account_filter_after_id:
+            self.root.after_cancel(self._account_filter_after_id)
+            self._account_filter_after_id = None
+        # Keys that don't edit the text (arrows, Shift, Ctrl) leave the list as it is
+        if self.account_search_entry.get().lower() == self._account_filter_text:
+            return
+        self._account_filter_after_id = self.root.after(150, self.filter_accounts)
     
     def filter_accounts(self, event=None):
         """Filter accounts list based on search text"""
-        self.refresh_account_list()
+        if self._account_filter_after_id:
+            self.root.after_cancel(self._account_filter_after_id)
+            self._account_filter_after_id = None
+        
+        search_text = self.account_search_entry.get().lower() if hasattr(self, 'account_search_entry') else ''
+        self._account_filter_text = search_text
+        
+        # Only search name, not SID
+        if search_text:
+            matches = set(self.match_accounts(search_text))
+            visible = [item_id for name, item_id in self.account_items.items() if name in matches]
+        else:
+            visible = list(self.account_items.values())
+        with self.bulk_update(self.accounts_tree):
+            self.accounts_tree.set_children('', *visible)
     
     def delete_selected_accounts(self):
         """Delete selected accounts from current accounts list"""
@@ -1453,15 +2153,16 @@ class TwilioGUI:
         if not messagebox.askyesno("Confirm Delete", f"Delete {count} account(s)?"):
             return
         
-        for item_id in selection:
-            values = self.accounts_tree.item(item_id)['values']
-            account_name = values[0]
+        # Look the names up by row instead of reading their values back from the tree
+        names = [self.account_item_names[item_id] for item_id in selection]
+        for account_name in names:
             self.config.delete_account(account_name)
+            self.discard_api(account_name)
         
-        self.refresh_accounts()
-        self.refresh_account_list()
-        messagebox.showinfo("Success", f"Deleted {count} account(s)")
-        self.account_mgmt_status.config(text=f"Deleted {count} account(s)")
+        self.accounts_changed(removed=names)
+        status = f"Deleted {count} account(s)"
+        self.account_mgmt_status.config(text=status)
+        messagebox.showinfo("Success", status)
     
     def prompt_initial_import(self):
         """Prompt user to import accounts on first run"""
@@ -1502,66 +2203,116 @@ class TwilioGUI:
             
             dialog.destroy()
             
-            try:
-                api = TwilioAPI(sid, token)
-                accounts = api.get_subaccounts()
-                
-                # Get existing SIDs
-                existing_sids = {details['account_sid'] for details in self.config.accounts.values()}
-                
-                imported = 0
-                for acc in accounts:
-                    if acc['sid'] not in existing_sids:
-                        name = acc['friendly_name'] or acc['sid']
-                        self.config.add_account(name, acc['sid'], acc['auth_token'])
-                        imported += 1
-                
-                self.refresh_accounts()
-                messagebox.showinfo("Import Complete", f"Imported {imported} account(s)")
+            def add_accounts(accounts):
+                existing_sids = self.config.account_sids
+                new_accounts = [(acc['friendly_name'] or acc['sid'], acc['sid'], acc['auth_token'])
+                                for acc in accounts if acc['sid'] not in existing_sids]
+                self.config.add_accounts(new_accounts)
                 
-            except Exception as e:
+                self.accounts_changed(added=[name for name, _, _ in new_accounts])
+                messagebox.showinfo("Import Complete", f"Imported {len(new_accounts)} account(s)")
+            
+            def show_error(e):
                 self.show_error_dialog("Failed to import accounts", str(e))
+            
+            # Only the fetch runs on the worker; accounts are saved on the Tk thread
+            self.run_in_background(self.subaccount_fetcher(sid, token), add_accounts, show_error)
         
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=2, column=0, columnspan=2, pady=10)
         ttk.Button(btn_frame, text="Import All", command=do_import).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
     
+    def schedule_account_dropdown_filter(self, combo, search_entry, count_label=None):
+        """Debounce dropdown search typing so a burst of keystrokes rewrites the combo values only once"""
+        after_id = self._dropdown_filter_after_ids.pop(combo, None)
+        if after_id:
+            self.root.after_cancel(after_id)
+        # Keys that don't edit the text (arrows, Shift, Ctrl) leave the values as they are
+        if search_entry.get().lower() == self._dropdown_filter_text.get(combo, ''):
+            return
+        self._dropdown_filter_after_ids[combo] = self.root.after(
+            80, lambda: self.filter_account_dropdown(combo, search_entry, count_label))
+    
+    def set_account_values(self, combo, names):
+        """Set an account combo's values, skipping the Tk update when the list is unchanged"""
+        values = tuple(names)
+        if self._combo_values.get(combo) != values:
+            self._combo_values[combo] = values
+            combo['values'] = values
+    
     def filter_account_dropdown(self, combo, search_entry, count_label=None):
         """Filter account dropdown based on search box"""
+        self._dropdown_filter_after_ids.pop(combo, None)
         typed = search_entry.get().lower()
+        self._dropdown_filter_text[combo] = typed
         if not typed:
-            combo['values'] = self.all_accounts
+            self.set_account_values(combo, self.all_accounts)
             if count_label:
                 count_label.config(text="")
         else:
-            filtered = [acc for acc in self.all_accounts if typed in acc.lower()]
-            combo['values'] = filtered
+            filtered = self.match_accounts(typed)
+            self.set_account_values(combo, filtered)
             if count_label:
                 count_label.config(text=f"({len(filtered)} matches)")
             # Set first match as current selection
             if filtered and combo.get() not in filtered:
                 combo.set(filtered[0])
     
+    def match_accounts(self, typed):
+        """Return the sorted account names containing typed, which must already be lowercase"""
+        entry = self._account_matches.get(typed)
+        if entry is not None:
+            self._account_matches.move_to_end(typed)
+            return entry[0]
+        
+        # A name containing typed also contains each of its prefixes, so narrow the matches
+        # for the longest prefix searched recently instead of scanning every account
+        names, lowers = self.all_accounts, self.all_accounts_lower
+        for end in range(len(typed) - 1, 0, -1):
+            if typed[:end] in self._account_matches:
+                names, lowers = self._account_matches[typed[:end]]
+                break
+        
+        if lowers is self.all_accounts_lower and len(lowers) > self.SUFFIX_INDEX_MIN_ACCOUNTS:
+            hits = self.suffix_matches(typed)
+        else:
+            hits = [i for i, lower in enumerate(lowers) if typed in lower]
+        entry = ([names[i] for i in hits], [lowers[i] for i in hits])
+        self._account_matches[typed] = entry
+        if len(self._account_matches) > 16:
+            self._account_matches.popitem(last=False)
+        return entry[0]
+    
+    def suffix_matches(self, typed):
+        """Return the sorted indices of the accounts whose lowercase name contains typed"""
+        if self._suffix_index is None:
+            pairs = sorted((lower[i:], idx) for idx, lower in enumerate(self.all_accounts_lower)
+                           for i in range(len(lower)))
+            self._suffix_index = ([suffix for suffix, _ in pairs], [idx for _, idx in pairs])
+        suffixes, owners = self._suffix_index
+        # Every suffix starting with typed sorts between typed and typed followed by the highest code point
+        start = bisect_left(suffixes, typed)
+        end = bisect_left(suffixes, typed + '\U0010ffff', start)
+        return sorted(set(owners[start:end]))
+    
     def filter_inactive_account_dropdown(self, event=None):
         """Filter inactive account dropdown as user types"""
         typed = self.inactive_account_combo.get().lower()
         if not typed:
-            self.inactive_account_combo['values'] = self.all_accounts
+            self.set_account_values(self.inactive_account_combo, self.all_accounts)
             return
         
-        filtered = [acc for acc in self.all_accounts if typed in acc.lower()]
-        self.inactive_account_combo['values'] = filtered
+        self.set_account_values(self.inactive_account_combo, self.match_accounts(typed))
     
     def filter_config_account_dropdown(self, event=None):
         """Filter config account dropdown as user types"""
         typed = self.config_account_combo.get().lower()
         if not typed:
-            self.config_account_combo['values'] = self.all_accounts
+            self.set_account_values(self.config_account_combo, self.all_accounts)
             return
         
-        filtered = [acc for acc in self.all_accounts if typed in acc.lower()]
-        self.config_account_combo['values'] = filtered
+        self.set_account_values(self.config_account_combo, self.match_accounts(typed))
 
 def main():
     root = tk.Tk()